@@ -1,318 +1,347 @@
-import json
-import re
-from typing import List, Dict, Any, Set
-
-class NarratorExtractor:
-    def __init__(self):
-        # Keywords for taadil (approval/praise) 
-        self.taadil_keywords = [
-            'ثقة', 'صدوق', 'حافظ', 'متقن', 'ضابط', 'عدل', 'مأمون',
-            'لا بأس به', 'صالح الحديث', 'يكتب حديثه', 'حجة', 'إمام',
-            'ثبت', 'عابد', 'فاضل', 'صالح', 'مقبول', 'رجل صالح',
-            'لا بأس', 'ما بال به', 'محله الصدق', 'صدق'
-        ]
-        
-        # Keywords for jarh (criticism) 
-        self.jarh_keywords = [
-            'ضعيف', 'متروك', 'كذاب', 'وضاع', 'منكر الحديث', 'واه',
-            'ليس بشيء', 'لا يحتج به', 'مجهول', 'ضعفه', 'تركه',
-            'ليس بالقوي', 'فيه ضعف', 'منكر', 'لا يعرف', 'مجروح',
-            'ليس بثقة', 'ضعيف الحديث'
-        ]
-        
-        # Arabic to English numeral mapping
-        self.arabic_to_english = str.maketrans('٠١٢٣٤٥٦٧٨٩', '0123456789')
-    
-    def convert_arabic_numerals(self, text: str) -> str:
-        """Convert Arabic-Indic numerals to English numerals"""
-        return text.translate(self.arabic_to_english)
-    
-    def extract_narrators(self, json_file_path: str) -> List[Dict[str, Any]]:
-        """Extract narrator information from JSON file"""
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        narrators = []
-        
-        # Handle the nested array structure
-        for volume_pages in data:
-            if isinstance(volume_pages, list):
-                for entry in volume_pages:
-                    if isinstance(entry, dict):
-                        text = entry.get('text', '')
-                        volume = entry.get('vol', '')
-                        page = entry.get('page', '')
-                        
-                        narrator_entries = self._extract_narrator_entries(text, volume, page)
-                        narrators.extend(narrator_entries)
-            elif isinstance(volume_pages, dict):
-                text = volume_pages.get('text', '')
-                volume = volume_pages.get('vol', '')
-                page = volume_pages.get('page', '')
-                
-                narrator_entries = self._extract_narrator_entries(text, volume, page)
-                narrators.extend(narrator_entries)
-        
-        return narrators
-    
-    def _extract_narrator_entries(self, text: str, volume: str, page: str) -> List[Dict[str, Any]]:
-        """Extract individual narrator entries from text"""
-        narrators = []
-        
-        # Convert Arabic numerals to English for processing
-        text_converted = self.convert_arabic_numerals(text)
-        
-        # Pattern to match narrator entries
-        pattern = r'(\d+)\s*-\s*([^\n]+)'
-        
-        matches = list(re.finditer(pattern, text_converted))
-        
-        for i, match in enumerate(matches):
-            narrator_id = match.group(1)
-            
-            # Get full text block for this narrator
-            start_pos = match.start()
-            if i + 1 < len(matches):
-                end_pos = matches[i + 1].start()
-            else:
-                end_pos = len(text_converted)
-            
-            full_text = text_converted[start_pos:end_pos]
-            full_text_original = text[start_pos:end_pos]
-            
-            # Extract narrator name
-            name = self._extract_name(full_text)
-            
-            # Extract taadil and jarh keywords only
-            taadil = self._extract_keywords(full_text_original, self.taadil_keywords)
-            jarh = self._extract_keywords(full_text_original, self.jarh_keywords)
-            
-            # Extract teachers (روى عن / سمع من)
-            teachers = self._extract_teachers(full_text_original)
-            
-            # Extract students (روى عنه)
-            students = self._extract_students(full_text_original)
-            
-            narrator_data = {
-                "narrator_id": f"N{narrator_id.zfill(5)}",
-                "full_name": name.strip(),
-                "taadil": taadil,
-                "jarh": jarh,
-                "teachers": teachers,
-                "students": students,
-                "source": {
-                    "volume": int(volume) if volume else 0,
-                    "page": int(page) if page else 0
-                }
-            }
-            
-            narrators.append(narrator_data)
-        
-        return narrators
-    
-    def _extract_name(self, text: str) -> str:
-        """Extract narrator name from text"""
-        # Remove the number prefix
-        text = re.sub(r'^\d+\s*-\s*', '', text)
-        
-        # Remove square brackets and their contents
-        text = re.sub(r'\[.*?\]', '', text)
-        
-        # Remove footnote markers
-        text = re.sub(r'\([٠-٩0-9]+\)', '', text)
-        
-        # Stop patterns for name extraction
-        stop_patterns = [
-            r'\sروت\s+عن',
-            r'\sروى\s+عن',
-            r'\sيروى\s+عن',
-            r'\sحدث',
-            r'\sقال',
-            r'\sسمعت',
-            r'\sنا\s',
-            r'\sاسمها\s',
-            r'\sاسمه\s',
-            r'\sمن\s+اصحاب',
-            r'\sله\s+صحبة',
-            r'\sمدينى',
-            r'\sبكري',
-            r'\sخزاعية',
-            r'\sانصارية',
-            r'\sامرأة'
-        ]
-        
-        min_pos = len(text)
-        for pattern in stop_patterns:
-            match = re.search(pattern, text)
-            if match and match.start() < min_pos:
-                min_pos = match.start()
-        
-        if min_pos < len(text):
-            name = text[:min_pos].strip()
-        else:
-            words = text.split()[:5]
-            name = ' '.join(words)
-        
-        name = name.strip().rstrip(',،;؛:.')
-        
-        # Limit to 6 words
-        words = name.split()
-        if len(words) > 6:
-            name = ' '.join(words[:6])
-        
-        return name
-    
-    def _extract_keywords(self, text: str, keywords: List[str]) -> List[str]:
-        """Extract only the taadil or jarh keywords found in text"""
-        found_keywords = []
-        
-        for keyword in keywords:
-            if keyword in text:
-                found_keywords.append(keyword)
-        
-        # Remove duplicates while preserving order
-        return list(dict.fromkeys(found_keywords))
-    
-    def _extract_teachers(self, text: str) -> List[str]:
-        """Extract teachers (those the narrator learned from)"""
-        teachers = []
-        
-        # Patterns for "narrated from" or "heard from"
-        patterns = [
-            r'روى\s+عن\s+([^،\.]+?)(?=[،\.\n]|روى عنه|سمعت|قال|نا\s|و)',
-            r'روت\s+عن\s+([^،\.]+?)(?=[،\.\n]|روى عنه|سمعت|قال|نا\s|و)',
-            r'سمع\s+من\s+([^،\.]+?)(?=[،\.\n]|روى عنه|سمعت|قال|نا\s|و)',
-            r'سمعت\s+من\s+([^،\.]+?)(?=[،\.\n]|روى عنه|سمعت|قال|نا\s|و)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                # Split by 'و' to get individual names
-                names = re.split(r'\s+و\s+', match)
-                
-                for name in names:
-                    teacher = name.strip()
-                    # Clean up
-                    teacher = re.sub(r'\[.*?\]', '', teacher)
-                    teacher = re.sub(r'\([٠-٩0-9]+\)', '', teacher)
-                    teacher = teacher.strip()
-                    
-                    # Remove common words that aren't names
-                    if teacher.startswith('عن '):
-                        teacher = teacher[3:].strip()
-                    
-                    # Skip if too short or contains metadata
-                    if (len(teacher) > 2 and 
-                        'بياض' not in teacher and 
-                        'احاديث' not in teacher and
-                        'حديث' not in teacher and
-                        teacher not in teachers):
-                        teachers.append(teacher)
-        
-        return teachers
-    
-    def _extract_students(self, text: str) -> List[str]:
-        """Extract students (those who narrated from this narrator)"""
-        students = []
-        
-        # Patterns for "narrated from him/her"
-        patterns = [
-            r'روى\s+عنه[اء]?\s+([^،\.]+?)(?=[،\.\n]|روى عن|سمعت|قال|نا\s|و)',
-            r'روت\s+عنه[اء]?\s+([^،\.]+?)(?=[،\.\n]|روى عن|سمعت|قال|نا\s|و)',
-            r'حدث\s+عنه[اء]?\s+([^،\.]+?)(?=[،\.\n]|روى عن|سمعت|قال|نا\s|و)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                # Split by 'و' to get individual names
-                names = re.split(r'\s+و\s+', match)
-                
-                for name in names:
-                    student = name.strip()
-                    # Clean up
-                    student = re.sub(r'\[.*?\]', '', student)
-                    student = re.sub(r'\([٠-٩0-9]+\)', '', student)
-                    student = student.strip()
-                    
-                    # Remove common prefixes
-                    if student.startswith('عنه '):
-                        student = student[4:].strip()
-                    if student.startswith('عنها '):
-                        student = student[5:].strip()
-                    
-                    # Skip if too short or contains metadata
-                    if (len(student) > 2 and 
-                        'بياض' not in student and 
-                        'احاديث' not in student and
-                        'حديث' not in student and
-                        student not in students):
-                        students.append(student)
-        
-        return students
-    
-    def save_to_json(self, narrators: List[Dict[str, Any]], output_file: str):
-        """Save extracted narrators to JSON file"""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(narrators, f, ensure_ascii=False, indent=2)
-        print(f"✓ Extracted {len(narrators)} narrators to {output_file}")
-
-
-def main():
-    """Main execution function"""
-    extractor = NarratorExtractor()
-    
-    input_file = 'all_pages_complete.json'
-    output_file = 'narrator_jarh_tadil.json'
-    
-    try:
-        print(f"Reading from {input_file}...")
-        narrators = extractor.extract_narrators(input_file)
-        
-        extractor.save_to_json(narrators, output_file)
-        
-        print(f"\n=== Extraction Summary ===")
-        print(f"Total narrators: {len(narrators)}")
-        
-        taadil_count = sum(1 for n in narrators if n['taadil'])
-        jarh_count = sum(1 for n in narrators if n['jarh'])
-        teachers_count = sum(1 for n in narrators if n['teachers'])
-        students_count = sum(1 for n in narrators if n['students'])
-        
-        print(f"Narrators with taadil: {taadil_count}")
-        print(f"Narrators with jarh: {jarh_count}")
-        print(f"Narrators with teachers: {teachers_count}")
-        print(f"Narrators with students: {students_count}")
-        
-        print(f"\n=== Sample Results ===")
-        for narrator in narrators[:5]:
-            print(f"\n{'='*60}")
-            print(f"ID: {narrator['narrator_id']}")
-            print(f"Name: {narrator['full_name']}")
-            print(f"Source: Vol {narrator['source']['volume']}, Page {narrator['source']['page']}")
-            
-            if narrator['taadil']:
-                print(f"Taadil: {', '.join(narrator['taadil'])}")
-            
-            if narrator['jarh']:
-                print(f"Jarh: {', '.join(narrator['jarh'])}")
-            
-            if narrator['teachers']:
-                print(f"Teachers ({len(narrator['teachers'])}): {narrator['teachers'][:3]}")
-            
-            if narrator['students']:
-                print(f"Students ({len(narrator['students'])}): {narrator['students'][:3]}")
-        
-    except FileNotFoundError:
-        print(f"Error: Input file '{input_file}' not found!")
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in input file - {e}")
-    except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
-
-
-if __name__ == "__main__":
+import json
+import multiprocessing
+import re
+import sys
+import textwrap
+from typing import Iterable, Iterator, List, Dict, Any, Set, Tuple
+
+import ahocorasick
+import ijson
+
+
+def _build_automaton(keywords: List[str]) -> 'ahocorasick.Automaton':
+    """Build an Aho-Corasick automaton matching all keywords in one pass"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+# Keywords for taadil (approval/praise)
+_TAADIL_KEYWORDS = [
+    'ثقة', 'صدوق', 'حافظ', 'متقن', 'ضابط', 'عدل', 'مأمون',
+    'لا بأس به', 'صالح الحديث', 'يكتب حديثه', 'حجة', 'إمام',
+    'ثبت', 'عابد', 'فاضل', 'صالح', 'مقبول', 'رجل صالح',
+    'لا بأس', 'ما بال به', 'محله الصدق', 'صدق'
+]
+
+# Keywords for jarh (criticism)
+_JARH_KEYWORDS = [
+    'ضعيف', 'متروك', 'كذاب', 'وضاع', 'منكر الحديث', 'واه',
+    'ليس بشيء', 'لا يحتج به', 'مجهول', 'ضعفه', 'تركه',
+    'ليس بالقوي', 'فيه ضعف', 'منكر', 'لا يعرف', 'مجروح',
+    'ليس بثقة', 'ضعيف الحديث'
+]
+
+# Compiled once at import and shared by every extractor instance
+_TAADIL_AUTOMATON = _build_automaton(_TAADIL_KEYWORDS)
+_JARH_AUTOMATON = _build_automaton(_JARH_KEYWORDS)
+
+# Pre-compiled patterns (compiling once at import avoids the re-cache lookup
+# and pattern-wrapping overhead on every call in the per-entry hot loops)
+_NUM_PREFIX_RE = re.compile(r'^\d+\s*-\s*')
+# Footnote markers and bracketed insertions, stripped in a single pass
+_FOOT_OR_BRACK_RE = re.compile(r'\([٠-٩0-9]+\)|\[.*?\]')
+# Arabic to English numeral mapping, built once and shared
+_ARABIC_TO_ENGLISH = str.maketrans('٠١٢٣٤٥٦٧٨٩', '0123456789')
+
+# Teacher ("narrated/heard from") and student ("narrated from him/her")
+# anchors fused into one pattern, so a single finditer pass replaces the
+# seven per-pattern scans; match.lastgroup tells the two apart. The name
+# captures are bounded so an entry with no stop character ahead fails
+# fast instead of growing the lazy capture across the whole entry
+_TS_RE = re.compile(
+    r'(?:رو[ىت]\s+عن|سمعت?\s+من)\s+(?P<t>[^،\.]{1,120}?)'
+    r'(?=[،\.\n]|روى عنه|سمعت|قال|نا\s|و)'
+    r'|(?:رو[ىت]|حدث)\s+عنه[اء]?\s+(?P<s>[^،\.]{1,120}?)'
+    r'(?=[،\.\n]|روى عن|سمعت|قال|نا\s|و)'
+)
+
+# Metadata words that disqualify a teacher/student candidate, checked with
+# one scan instead of three separate substring searches
+_METADATA_RE = re.compile(r'بياض|احاديث|حديث')
+
+# Stop patterns for name extraction, fused into one alternation so a single
+# scan finds the leftmost stop instead of 16 separate searches per narrator
+_NAME_STOP_RE = re.compile(
+    r'\s(?:روت\s+عن|روى\s+عن|يروى\s+عن|حدث|قال|سمعت|نا\s|اسمها\s|اسمه\s'
+    r'|من\s+اصحاب|له\s+صحبة|مدينى|بكري|خزاعية|انصارية|امرأة)'
+)
+
+class NarratorExtractor:
+    def __init__(self):
+        self.taadil_keywords = _TAADIL_KEYWORDS
+        self.jarh_keywords = _JARH_KEYWORDS
+
+        # Aho-Corasick automatons so each entry is scanned once for all
+        # keywords instead of once per keyword
+        self._taadil_automaton = _TAADIL_AUTOMATON
+        self._jarh_automaton = _JARH_AUTOMATON
+    
+    def convert_arabic_numerals(self, text: str) -> str:
+        """Convert Arabic-Indic numerals to English numerals"""
+        return text.translate(_ARABIC_TO_ENGLISH)
+    
+    def extract_narrators(self, json_file_path: str,
+                          processes: int = None) -> Iterator[Dict[str, Any]]:
+        """Extract narrator information from JSON file, one page at a time"""
+        with open(json_file_path, 'rb') as f:
+            # Pages are independent, so fan them out across cores; imap
+            # keeps both the input streaming and the output order
+            with multiprocessing.Pool(processes, initializer=_init_worker) as pool:
+                for narrators in pool.imap(_process_page, self._iter_pages(f),
+                                           chunksize=32):
+                    yield from narrators
+
+    @staticmethod
+    def _iter_pages(f) -> Iterator[Tuple[str, str, str]]:
+        """Stream (text, vol, page) tuples from the nested array structure
+
+        Streaming instead of json.load-ing the whole corpus means only one
+        page's text is resident at a time.
+        """
+        for volume_pages in ijson.items(f, 'item'):
+            if isinstance(volume_pages, list):
+                for entry in volume_pages:
+                    if isinstance(entry, dict):
+                        yield (entry.get('text', ''),
+                               entry.get('vol', ''),
+                               entry.get('page', ''))
+            elif isinstance(volume_pages, dict):
+                yield (volume_pages.get('text', ''),
+                       volume_pages.get('vol', ''),
+                       volume_pages.get('page', ''))
+    
+    def _extract_narrator_entries(self, text: str, volume: str, page: str) -> List[Dict[str, Any]]:
+        """Extract individual narrator entries from text"""
+        narrators = []
+        
+        # Convert Arabic numerals to English for processing
+        text_converted = self.convert_arabic_numerals(text)
+        
+        # Find entry headers (a numeric prefix followed by '-' at the start
+        # of a line) with a plain line walk instead of a regex scan
+        headers = []  # (narrator_id, position of the numeric prefix)
+        pos = 0
+        for line in text_converted.splitlines(keepends=True):
+            stripped = line.lstrip()
+            digits = 0
+            while digits < len(stripped) and stripped[digits].isdigit():
+                digits += 1
+            if digits > 0 and stripped[digits:].lstrip().startswith('-'):
+                headers.append((stripped[:digits], pos + len(line) - len(stripped)))
+            pos += len(line)
+
+        for i, (narrator_id, start_pos) in enumerate(headers):
+            # Get full text block for this narrator
+            if i + 1 < len(headers):
+                end_pos = headers[i + 1][1]
+            else:
+                end_pos = len(text_converted)
+            
+            # The keyword and name patterns are digit-agnostic, so the
+            # converted text serves every extractor; no need for a second
+            # slice of the original
+            full_text = text_converted[start_pos:end_pos]
+
+            # Extract narrator name
+            name = self._extract_name(full_text)
+
+            # Extract taadil and jarh keywords only
+            taadil = self._extract_keywords(full_text, self._taadil_automaton)
+            jarh = self._extract_keywords(full_text, self._jarh_automaton)
+
+            # Extract teachers (روى عن / سمع من) and students (روى عنه)
+            teachers, students = self._extract_teachers_students(full_text)
+            
+            narrator_data = {
+                "narrator_id": f"N{narrator_id.zfill(5)}",
+                "full_name": name.strip(),
+                "taadil": taadil,
+                "jarh": jarh,
+                "teachers": teachers,
+                "students": students,
+                "source": {
+                    "volume": int(volume) if volume else 0,
+                    "page": int(page) if page else 0
+                }
+            }
+            
+            narrators.append(narrator_data)
+        
+        return narrators
+    
+    def _extract_name(self, text: str) -> str:
+        """Extract narrator name from text"""
+        # Remove the number prefix
+        text = _NUM_PREFIX_RE.sub('', text)
+
+        # Remove footnote markers and square brackets with their contents
+        text = _FOOT_OR_BRACK_RE.sub('', text)
+
+        # The regex engine returns the leftmost match of the alternation,
+        # so no manual min_pos bookkeeping is needed
+        match = _NAME_STOP_RE.search(text)
+        min_pos = match.start() if match else len(text)
+
+        if min_pos < len(text):
+            name = text[:min_pos].strip()
+        else:
+            words = text.split()[:5]
+            name = ' '.join(words)
+        
+        name = name.strip().rstrip(',،;؛:.')
+        
+        # Limit to 6 words
+        words = name.split()
+        if len(words) > 6:
+            name = ' '.join(words[:6])
+        
+        return name
+    
+    def _extract_keywords(self, text: str,
+                          automaton: 'ahocorasick.Automaton') -> List[str]:
+        """Extract only the taadil or jarh keywords found in text"""
+        # Single automaton pass with longest-match semantics, so a generic
+        # term is not also reported where a more specific multi-word term
+        # matched (e.g. 'ضعيف' inside 'ضعيف الحديث'); dict.fromkeys dedups
+        # while preserving the order keywords appear in the text
+        return list(dict.fromkeys(keyword for _, keyword in automaton.iter_long(text)))
+    
+    def _extract_teachers_students(self, text: str) -> Tuple[List[str], List[str]]:
+        """Extract teachers (learned from) and students (narrated from
+        this narrator) in a single pass over the entry"""
+        # Insertion-ordered dicts give O(1) duplicate checks while keeping
+        # the output order a list would have had
+        teachers: Dict[str, None] = {}
+        students: Dict[str, None] = {}
+
+        for match in _TS_RE.finditer(text):
+            is_teacher = match.lastgroup == 't'
+            found = teachers if is_teacher else students
+
+            # Split by 'و' to get individual names; a literal split
+            # avoids the regex engine for this fixed delimiter
+            names = match.group(match.lastgroup).split(' و ')
+
+            for name in names:
+                # Clean up
+                cleaned = _FOOT_OR_BRACK_RE.sub('', name).strip()
+
+                # Remove common prefixes that aren't names
+                if is_teacher:
+                    if cleaned.startswith('عن '):
+                        cleaned = cleaned[3:].strip()
+                else:
+                    if cleaned.startswith('عنه '):
+                        cleaned = cleaned[4:].strip()
+                    if cleaned.startswith('عنها '):
+                        cleaned = cleaned[5:].strip()
+
+                # Skip if too short or contains metadata
+                if (len(cleaned) > 2 and
+                    not _METADATA_RE.search(cleaned)):
+                    # Famous names recur across thousands of entries;
+                    # interning collapses the repeated slices to one object
+                    found[sys.intern(cleaned)] = None
+
+        return list(teachers), list(students)
+
+    def save_to_json(self, narrators: Iterable[Dict[str, Any]], output_file: str):
+        """Save extracted narrators to JSON file, one record at a time"""
+        count = 0
+        with open(output_file, 'w', encoding='utf-8') as f:
+            # Dump record by record so neither the record list nor the full
+            # serialized document is ever held in memory at once
+            f.write('[\n')
+            for narrator in narrators:
+                if count:
+                    f.write(',\n')
+                f.write(textwrap.indent(
+                    json.dumps(narrator, ensure_ascii=False, indent=2), '  '))
+                count += 1
+            f.write('\n]')
+        print(f"✓ Extracted {count} narrators to {output_file}")
+
+
+# Per-worker extractor, created once per process by the Pool initializer
+_worker_extractor = None
+
+
+def _init_worker():
+    global _worker_extractor
+    _worker_extractor = NarratorExtractor()
+
+
+def _process_page(args: Tuple[str, str, str]) -> List[Dict[str, Any]]:
+    """Extract the narrator entries of a single page (runs in a worker)"""
+    text, volume, page = args
+    return _worker_extractor._extract_narrator_entries(text, volume, page)
+
+
+def main():
+    """Main execution function"""
+    extractor = NarratorExtractor()
+    
+    input_file = 'all_pages_complete.json'
+    output_file = 'narrator_jarh_tadil.json'
+    
+    try:
+        print(f"Reading from {input_file}...")
+
+        # Tally the summary while save_to_json streams records to disk,
+        # so the full narrator list is never materialized
+        counts = {'total': 0, 'taadil': 0, 'jarh': 0, 'teachers': 0, 'students': 0}
+        samples = []
+
+        def tally(records):
+            for narrator in records:
+                counts['total'] += 1
+                for key in ('taadil', 'jarh', 'teachers', 'students'):
+                    if narrator[key]:
+                        counts[key] += 1
+                if len(samples) < 5:
+                    samples.append(narrator)
+                yield narrator
+
+        extractor.save_to_json(tally(extractor.extract_narrators(input_file)),
+                               output_file)
+
+        print(f"\n=== Extraction Summary ===")
+        print(f"Total narrators: {counts['total']}")
+        print(f"Narrators with taadil: {counts['taadil']}")
+        print(f"Narrators with jarh: {counts['jarh']}")
+        print(f"Narrators with teachers: {counts['teachers']}")
+        print(f"Narrators with students: {counts['students']}")
+
+        print(f"\n=== Sample Results ===")
+        for narrator in samples:
+            print(f"\n{'='*60}")
+            print(f"ID: {narrator['narrator_id']}")
+            print(f"Name: {narrator['full_name']}")
+            print(f"Source: Vol {narrator['source']['volume']}, Page {narrator['source']['page']}")
+            
+            if narrator['taadil']:
+                print(f"Taadil: {', '.join(narrator['taadil'])}")
+            
+            if narrator['jarh']:
+                print(f"Jarh: {', '.join(narrator['jarh'])}")
+            
+            if narrator['teachers']:
+                print(f"Teachers ({len(narrator['teachers'])}): {narrator['teachers'][:3]}")
+            
+            if narrator['students']:
+                print(f"Students ({len(narrator['students'])}): {narrator['students'][:3]}")
+        
+    except FileNotFoundError:
+        print(f"Error: Input file '{input_file}' not found!")
+    except (json.JSONDecodeError, ijson.JSONError) as e:
+        print(f"Error: Invalid JSON in input file - {e}")
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file